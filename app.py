@@ -5,48 +5,295 @@ Provides REST API endpoints for blog generation and topic management
 """
 
 import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+import orjson
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-from dotenv import load_dotenv
-from main import BlogGenerator
+from config import CONFIG
+from blog_generator import BlogGenerator
+from blog_cache import BlogCache
+from utils import sanitize_filename
 from topic_manager import TopicManager
 from datetime import datetime
+from typing import Optional
+
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson: compact output, keys kept in insertion order"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
-# Load environment variables
-load_dotenv()
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)  # Enable CORS for all routes
 
 # Configuration
-app.config['JSON_SORT_KEYS'] = False
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max request size
+MAX_TOPIC_LENGTH = 500  # Longest accepted topic, in characters
+MAX_BATCH_TOPICS = 20  # Most topics accepted by /api/generate/batch
+
+# Shared blog generator (OpenAI client, S3 client), built on first use
+_GENERATOR = None
+_GENERATOR_LOCK = threading.Lock()
+
+
+def _get_generator() -> BlogGenerator:
+    """
+    Return the process-wide BlogGenerator, creating it on first call
+
+    The OpenAI client owns an HTTP connection pool and the boto3 S3 client is
+    thread-safe, so one instance is shared by all requests instead of paying
+    client construction and TLS handshakes on every call.
+    """
+    global _GENERATOR
+    if _GENERATOR is None:
+        with _GENERATOR_LOCK:
+            if _GENERATOR is None:
+                _GENERATOR = BlogGenerator()
+    return _GENERATOR
+
+
+def _embed_topic(topic: str) -> list:
+    """Embed a topic for semantic cache lookups"""
+    return _get_generator().embed_text(topic)
+
+
+# Generated articles, keyed by normalized topic. Set BLOG_CACHE_SEMANTIC=true
+# to also match similar topics by embedding distance.
+BLOG_CACHE = BlogCache(
+    ttl=CONFIG.blog_cache_ttl,
+    embed=_embed_topic if CONFIG.blog_cache_semantic else None
+)
+
+
+# Topics are read from disk once and reloaded when the file changes
+TOPIC_MANAGER = TopicManager()
+
+
+# Background generation jobs, keyed by job id. Finished jobs are dropped
+# JOB_RESULT_TTL seconds after they complete so results do not pile up.
+EXECUTOR = ThreadPoolExecutor(max_workers=CONFIG.blog_workers)
+JOBS: dict[str, Future] = {}
+_JOB_FINISHED_AT: dict[str, float] = {}
+_JOBS_LOCK = threading.Lock()
+
+
+def _submit_job(fn, data: dict) -> str:
+    """
+    Queue a generation job and return its id
+    
+    Args:
+        fn: Job function (_run_job or _run_batch_job)
+        data: Validated request body passed to fn
+        
+    Returns:
+        Job id to poll with GET /api/generate/<job_id>
+    """
+    _prune_jobs()
+    
+    job_id = uuid.uuid4().hex
+    future = EXECUTOR.submit(fn, data)
+    with _JOBS_LOCK:
+        JOBS[job_id] = future
+    future.add_done_callback(lambda _: _mark_job_finished(job_id))
+    return job_id
+
+
+def _mark_job_finished(job_id: str):
+    """Record when a job finished, starting its result TTL"""
+    with _JOBS_LOCK:
+        _JOB_FINISHED_AT[job_id] = time.monotonic()
+
+
+def _prune_jobs():
+    """Drop jobs whose results have been kept longer than JOB_RESULT_TTL"""
+    cutoff = time.monotonic() - CONFIG.job_result_ttl
+    with _JOBS_LOCK:
+        for job_id in [j for j, finished_at in _JOB_FINISHED_AT.items() if finished_at <= cutoff]:
+            del _JOB_FINISHED_AT[job_id]
+            JOBS.pop(job_id, None)
+
+
+# /api/health response body, built once; only the timestamp changes per call
+_HEALTH_BODY_TEMPLATE = orjson.dumps({
+    'status': 'healthy',
+    'timestamp': '%s',
+    'timezone': 'UTC',
+    'services': {
+        'openai': bool(CONFIG.openai_api_key),
+        's3': bool(CONFIG.s3_bucket_name),
+        'email': bool(CONFIG.email_user)
+    }
+}).decode('utf-8')
 
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.utcnow().isoformat() + 'Z',
-        'timezone': 'UTC',
-        'services': {
-            'openai': bool(os.getenv('OPENAI_API_KEY')),
-            's3': bool(os.getenv('AWS_S3_BUCKET_NAME')),
-            'email': bool(os.getenv('EMAIL_USER'))
-        }
-    }), 200
+    body = _HEALTH_BODY_TEMPLATE % (datetime.utcnow().isoformat() + 'Z')
+    return body, 200, {'Content-Type': 'application/json'}
+
+
+def _clean_topic(topic) -> Optional[str]:
+    """
+    Strip a requested topic and check its length
+    
+    Returns:
+        The stripped topic, or None if it is not a string of 1-MAX_TOPIC_LENGTH characters
+    """
+    if not isinstance(topic, str):
+        return None
+    topic = topic.strip()
+    if not topic or len(topic) > MAX_TOPIC_LENGTH:
+        return None
+    return topic
+
+
+def _run_job(data: dict) -> dict:
+    """
+    Run the full generation pipeline for a single request
+    
+    Args:
+        data: Validated request body (must contain 'topic')
+        
+    Returns:
+        Result dictionary returned to the client once the job completes
+    """
+    topic = data['topic']
+    audience = data.get('audience', 'General readers interested in the topic')
+    
+    # Reuse the shared blog generator
+    generator = _get_generator()
+    
+    upload = None
+    cached = BLOG_CACHE.get(topic)
+    if cached:
+        print(f"Using cached blog for topic: {topic}")
+        article = cached['article']
+        pdf_filename = cached['pdf_filename']
+        s3_url = cached['s3_url']
+        timestamp = cached['timestamp']
+        
+        # Rebuild the PDF if the local copy has been removed
+        if not os.path.exists(pdf_filename):
+            generator.create_pdf(article, pdf_filename, title=topic)
+    else:
+        # Generate article and create PDF as it streams in
+        print(f"Generating blog for topic: {topic}")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_topic = sanitize_filename(topic)
+        # Random suffix: batch topics generated in the same second may sanitize to the same name
+        pdf_filename = f"blog_article_{safe_topic}_{timestamp}_{uuid.uuid4().hex[:8]}.pdf"
+        
+        article = generator.generate_blog_pdf(topic, pdf_filename, title=topic)
+        
+        # Upload to S3 if configured, in the background while recipients are collected
+        s3_url = None
+        if generator.s3_handler.enabled:
+            upload = generator.s3_handler.upload_file_async(pdf_filename)
+    
+    # Send emails if requested
+    # Start with emails from the request
+    request_emails = data.get('email_list', [])
+    if 'email' in data and data['email']:
+        if isinstance(request_emails, list):
+            # Copy rather than append: batch jobs share the request body
+            request_emails = request_emails + [data['email']]
+        else:
+            request_emails = [data['email']]
+    
+    # Load emails from email_list.txt (subscribers)
+    subscriber_emails = generator.load_email_list()
+    
+    # Combine lists (avoiding duplicates)
+    all_recipients = list(set(request_emails + subscriber_emails))
+    
+    if upload is not None:
+        s3_url = upload.result()
+    
+    # Don't cache an article whose S3 upload failed: later hits would reuse
+    # the missing link instead of retrying the upload
+    upload_failed = upload is not None and s3_url is None
+    if not cached and not upload_failed:
+        BLOG_CACHE.set(topic, {
+            'article': article,
+            'pdf_filename': pdf_filename,
+            's3_url': s3_url,
+            'timestamp': timestamp
+        })
+    
+    emails_sent = []
+    if all_recipients and generator.email_enabled:
+        print(f"Sending emails to {len(all_recipients)} recipients...")
+        emails_sent = generator.send_emails(all_recipients, pdf_filename, subject=f"Blog Article: {topic}", s3_url=s3_url)
+    
+    return {
+        'success': True,
+        'topic': topic,
+        'article': article,
+        'pdf_filename': pdf_filename,
+        's3_url': s3_url,
+        'emails_sent': emails_sent,
+        'timestamp': timestamp,
+        'cached': bool(cached)
+    }
+
+
+def _run_batch_job(data: dict) -> dict:
+    """
+    Run the generation pipeline for several topics in parallel
+    
+    Args:
+        data: Validated request body (must contain 'topics')
+        
+    Returns:
+        Result dictionary with one entry per topic, in request order
+    """
+    def run_topic(topic):
+        try:
+            return _run_job({**data, 'topic': topic})
+        except Exception as e:
+            return {
+                'success': False,
+                'topic': topic,
+                'error': str(e)
+            }
+    
+    topics = data['topics']
+    # Generate each distinct topic once; repeated topics share its result
+    unique_topics = list(dict.fromkeys(topics))
+    with ThreadPoolExecutor(max_workers=min(CONFIG.openai_max_concurrency, len(unique_topics))) as executor:
+        results_by_topic = dict(zip(unique_topics, executor.map(run_topic, unique_topics)))
+    results = [results_by_topic[topic] for topic in topics]
+    
+    return {
+        'success': all(result['success'] for result in results),
+        'count': len(results),
+        'results': results
+    }
 
 
 @app.route('/api/generate', methods=['POST'])
 def generate_blog():
     """
-    Generate a blog article
+    Submit a blog generation job
+    
+    Generation runs in the background; poll GET /api/generate/<job_id>
+    for the result.
     
     Request body:
     {
-        "topic": "string (required)",
+        "topic": "string (required, 1-500 characters)",
         "audience": "string (optional)",
         "email": "user@example.com (optional)",
         "email_list": ["email1@example.com", "email2@example.com"] (optional)
@@ -60,63 +307,74 @@ def generate_blog():
                 'error': 'Missing required field: topic'
             }), 400
         
-        topic = data['topic']
-        audience = data.get('audience', 'General readers interested in the topic')
+        topic = _clean_topic(data['topic'])
+        if topic is None:
+            return jsonify({
+                'error': f'topic must be a string of 1-{MAX_TOPIC_LENGTH} characters'
+            }), 400
+        data = {**data, 'topic': topic}
         
-        # Initialize blog generator
-        generator = BlogGenerator()
+        # Fail fast on configuration errors (e.g. missing OpenAI key)
+        _get_generator()
         
-        # Generate article
-        print(f"Generating blog for topic: {topic}")
-        article = generator.generate_blog_article(topic)
+        job_id = _submit_job(_run_job, data)
         
-        # Create PDF
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_topic = "".join(c for c in topic[:50] if c.isalnum() or c in (' ', '-', '_')).strip()
-        safe_topic = safe_topic.replace(' ', '_')
-        pdf_filename = f"blog_article_{safe_topic}_{timestamp}.pdf"
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'status': 'pending'
+        }), 202
         
-        generator.create_pdf(article, pdf_filename, title=topic)
+    except Exception as e:
+        return jsonify({
+            'error': str(e)
+        }), 500
+
+
+@app.route('/api/generate/batch', methods=['POST'])
+def generate_blog_batch():
+    """
+    Submit one job that generates a blog article for each of several topics
+    
+    Request body:
+    {
+        "topics": ["topic 1", "topic 2"] (required, 1-20 topics),
+        "audience": "string (optional)",
+        "email": "user@example.com (optional)",
+        "email_list": ["email1@example.com", "email2@example.com"] (optional)
+    }
+    """
+    try:
+        data = request.get_json()
         
-        # Upload to S3 if configured
-        s3_url = None
-        if generator.s3_handler.enabled:
-            s3_url = generator.s3_handler.upload_file(pdf_filename)
-        
-        # Send emails if requested
-        # Start with emails from the request
-        request_emails = data.get('email_list', [])
-        if 'email' in data and data['email']:
-            if isinstance(request_emails, list):
-                request_emails.append(data['email'])
-            else:
-                request_emails = [data['email']]
-        
-        # Load emails from email_list.txt (subscribers)
-        subscriber_emails = generator.load_email_list()
-        
-        # Combine lists (avoiding duplicates)
-        all_recipients = list(set(request_emails + subscriber_emails))
-        
-        emails_sent = []
-        if all_recipients and generator.email_enabled:
-            print(f"Sending emails to {len(all_recipients)} recipients...")
-            for email in all_recipients:
-                try:
-                    generator.send_email(email, pdf_filename, subject=f"Blog Article: {topic}", s3_url=s3_url)
-                    emails_sent.append(email)
-                except Exception as e:
-                    print(f"Error sending email to {email}: {str(e)}")
+        if not data or 'topics' not in data:
+            return jsonify({
+                'error': 'Missing required field: topics'
+            }), 400
+        
+        raw_topics = data['topics']
+        if not isinstance(raw_topics, list) or not 1 <= len(raw_topics) <= MAX_BATCH_TOPICS:
+            return jsonify({
+                'error': f'topics must be a list of 1-{MAX_BATCH_TOPICS} topics'
+            }), 400
+        
+        topics = [_clean_topic(topic) for topic in raw_topics]
+        if None in topics:
+            return jsonify({
+                'error': f'Each topic must be a string of 1-{MAX_TOPIC_LENGTH} characters'
+            }), 400
+        data = {**data, 'topics': topics}
+        
+        # Fail fast on configuration errors (e.g. missing OpenAI key)
+        _get_generator()
+        
+        job_id = _submit_job(_run_batch_job, data)
         
         return jsonify({
             'success': True,
-            'topic': topic,
-            'article': article,
-            'pdf_filename': pdf_filename,
-            's3_url': s3_url,
-            'emails_sent': emails_sent,
-            'timestamp': timestamp
-        }), 200
+            'job_id': job_id,
+            'status': 'pending'
+        }), 202
         
     except Exception as e:
         return jsonify({
@@ -124,12 +382,42 @@ def generate_blog():
         }), 500
 
 
+@app.route('/api/generate/<job_id>', methods=['GET'])
+def get_generate_job(job_id):
+    """Get the status (and result, once finished) of a blog generation job"""
+    _prune_jobs()
+    future = JOBS.get(job_id)
+    if future is None:
+        return jsonify({
+            'error': 'Job not found'
+        }), 404
+    
+    if not future.done():
+        return jsonify({
+            'job_id': job_id,
+            'status': 'running' if future.running() else 'pending'
+        }), 200
+    
+    error = future.exception()
+    if error is not None:
+        return jsonify({
+            'job_id': job_id,
+            'status': 'failed',
+            'error': str(error)
+        }), 200
+    
+    return jsonify({
+        'job_id': job_id,
+        'status': 'completed',
+        **future.result()
+    }), 200
+
+
 @app.route('/api/topics', methods=['GET'])
 def get_topics():
     """Get all topics from local file"""
     try:
-        topic_manager = TopicManager()
-        topics = topic_manager.get_all_topics()
+        topics = TOPIC_MANAGER.get_all_topics()
         
         return jsonify({
             'success': True,
@@ -147,8 +435,7 @@ def get_topics():
 def get_today_topic():
     """Get today's scheduled topic (UTC)"""
     try:
-        topic_manager = TopicManager()
-        topic = topic_manager.get_next_available_topic()
+        topic = TOPIC_MANAGER.get_next_available_topic()
         
         if not topic:
             return jsonify({
@@ -161,7 +448,7 @@ def get_today_topic():
             'source': 'local_file',
             'date': datetime.utcnow().strftime("%Y-%m-%d"),
             'timezone': 'UTC'
-        }), 200
+        }), 200, {'Cache-Control': 'public, max-age=60'}
         
     except Exception as e:
         return jsonify({
@@ -200,6 +487,8 @@ if __name__ == '__main__':
     print(f"API endpoints:")
     print(f"  GET  /api/health")
     print(f"  POST /api/generate")
+    print(f"  POST /api/generate/batch")
+    print(f"  GET  /api/generate/<job_id>")
     print(f"  GET  /api/topics")
     print(f"  GET  /api/topics/today")
     print(f"  GET  /api/topics/next")
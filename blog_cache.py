@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Blog Cache - In-memory cache of generated blog articles keyed by topic
+"""
+
+import hashlib
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Most embeddings kept from missed lookups while their articles are generated
+MAX_PENDING_VECTORS = 256
+
+
+class BlogCache:
+    def __init__(self, ttl: int = 86400, embed: Optional[Callable[[str], List[float]]] = None,
+                 max_distance: float = 0.15):
+        """
+        Initialize the blog cache
+        
+        Args:
+            ttl: Seconds a cached article stays valid (default: 24 hours)
+            embed: Optional function returning a unit-length embedding for a topic.
+                   When given, topics that miss the exact lookup are matched by
+                   cosine distance against previously cached topics.
+            max_distance: Maximum cosine distance for a semantic cache hit
+        """
+        self.ttl = ttl
+        self.embed = embed
+        self.max_distance = max_distance
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[float, Dict]] = {}
+        self._vectors: Dict[str, List[float]] = {}
+        # Embeddings computed by a missed lookup, reused when the article is stored
+        self._pending_vectors: Dict[str, List[float]] = {}
+    
+    @staticmethod
+    def key(topic: str) -> str:
+        """Return the cache key for a topic (hash of the normalized topic)"""
+        return hashlib.sha256(topic.strip().lower().encode('utf-8')).hexdigest()
+    
+    def get(self, topic: str) -> Optional[Dict]:
+        """
+        Look up a cached article for a topic
+        
+        Args:
+            topic: Blog topic
+        
+        Returns:
+            Cached entry dictionary, or None on a miss
+        """
+        key = self.key(topic)
+        now = time.time()
+        
+        with self._lock:
+            entry = self._live_entry(key, now)
+            if entry is not None:
+                return entry
+            if self.embed is None or not self._vectors:
+                return None
+        
+        try:
+            vector = self.embed(topic)
+        except Exception as e:
+            print(f"⚠️  Error embedding topic for cache lookup: {str(e)}")
+            return None
+        
+        with self._lock:
+            best_key, best_distance = None, None
+            for cached_key, cached_vector in self._vectors.items():
+                distance = 1.0 - sum(a * b for a, b in zip(vector, cached_vector))
+                if best_distance is None or distance < best_distance:
+                    best_key, best_distance = cached_key, distance
+            
+            entry = None
+            if best_key is not None and best_distance < self.max_distance:
+                entry = self._live_entry(best_key, now)
+            
+            if entry is not None:
+                self._pending_vectors.pop(key, None)
+                return entry
+            
+            # Miss: keep the embedding for the set() that follows generation.
+            # Lookups whose generation fails never call set(), so only the most
+            # recent MAX_PENDING_VECTORS embeddings are kept.
+            self._pending_vectors.pop(key, None)
+            self._pending_vectors[key] = vector
+            while len(self._pending_vectors) > MAX_PENDING_VECTORS:
+                del self._pending_vectors[next(iter(self._pending_vectors))]
+        
+        return None
+    
+    def set(self, topic: str, entry: Dict):
+        """
+        Store a generated article for a topic
+        
+        Args:
+            topic: Blog topic
+            entry: Data to cache (e.g. article, pdf_filename, s3_url, timestamp)
+        """
+        key = self.key(topic)
+        now = time.time()
+        
+        with self._lock:
+            vector = self._pending_vectors.pop(key, None)
+        
+        if vector is None and self.embed is not None:
+            try:
+                vector = self.embed(topic)
+            except Exception as e:
+                print(f"⚠️  Error embedding topic for cache: {str(e)}")
+        
+        with self._lock:
+            # Drop expired entries before adding the new one
+            for expired_key in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+                self._remove(expired_key)
+            
+            self._entries[key] = (now + self.ttl, entry)
+            if vector is not None:
+                self._vectors[key] = vector
+    
+    def _live_entry(self, key: str, now: float) -> Optional[Dict]:
+        """Return the entry for a key if it has not expired (caller holds the lock)"""
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        
+        expires_at, entry = cached
+        if expires_at <= now:
+            self._remove(key)
+            return None
+        return entry
+    
+    def _remove(self, key: str):
+        """Remove an entry and its embedding (caller holds the lock)"""
+        self._entries.pop(key, None)
+        self._vectors.pop(key, None)
+        self._pending_vectors.pop(key, None)
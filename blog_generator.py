@@ -0,0 +1,621 @@
+#!/usr/bin/env python3
+"""
+Blog Generator - Creates blog articles from prompts and emails them as PDFs
+
+Library module; the command-line entry point is main.py.
+"""
+
+import contextlib
+import os
+import re
+import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.message import EmailMessage
+from openai import OpenAI
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from datetime import datetime
+from typing import Iterable, Iterator, Optional, Union
+from config import CONFIG
+from s3_handler import S3Handler
+from utils import sanitize_filename
+
+# Matches one article line, stripped of surrounding whitespace. Groups are the
+# heading marker ('##' or '###' followed by a space and text, otherwise a
+# leading '#' title marker) and the remaining text.
+_LINE_RE = re.compile(r'^[^\S\n]*(###?(?= [^\S\n]*\S)|#)?[^\S\n]*(.*?)[^\S\n]*$', re.M)
+
+# Paragraph style for each heading marker (None is body text)
+_MARKER_STYLES = {'#': 'title', '##': 'heading', '###': 'sub', None: 'body'}
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.*?)\*')
+
+# Base stylesheet for the PDF paragraph styles
+_SAMPLE_STYLES = getSampleStyleSheet()
+
+# System prompt used when frame.txt is missing or empty
+DEFAULT_PROMPT = """You are an expert-level writer who specializes in creating authoritative, well-researched, and polished professional blogs. Follow these instructions carefully:
+
+Topic: {topic}
+
+Goal:
+- Explain the topic with clarity and depth
+- Provide original insights, not generic filler
+- Use real facts or credible reasoning—never invent data
+- Challenge assumptions and add expert-level commentary
+
+Tone & Style:
+- Professional, concise, confident
+- No fluff, no motivational padding
+- No clichés or obvious statements
+- Short, punchy sentences with tight logic
+- Maintain a human, analytical voice
+
+Structure:
+- Strong, problem-focused introduction
+- Clear, non-generic headings
+- Use real examples when they strengthen the argument
+- Include at least one unconventional insight
+- Provide actionable takeaways
+- Conclusion must reinforce the central argument
+
+Depth & Constraints:
+- Write at expert depth—assume an intelligent reader
+- Target 900–1400 words
+- Avoid surface-level summaries
+- Ensure logical narrative arc
+
+Quality Rules:
+- No fake stats, sources, or invented research
+- No repetition, filler, or vague statements
+- Flow and quality must match top-tier publications
+
+Format the article with markdown-style headings (## for main headings, ### for subheadings)."""
+
+# Last prompt template loaded and the frame.txt mtime it was read at
+_PROMPT_CACHE = {'mtime': None, 'content': None}
+
+
+class BlogGenerator:
+    # PDF paragraph styles, shared by all instances (see _init_styles)
+    _styles = None
+    
+    def __init__(self):
+        """Initialize the Blog Generator with API keys and configuration"""
+        self.api_key = CONFIG.openai_api_key
+        if not self.api_key:
+            raise ValueError("OPENAI_API_KEY not found in environment variables")
+        
+        self.client = OpenAI(api_key=self.api_key)
+        self.model = CONFIG.openai_model
+        # Limits concurrent generations (API jobs, batches) to stay under rate limits
+        self._openai_slots = threading.BoundedSemaphore(CONFIG.openai_max_concurrency)
+        
+        # Email configuration (optional)
+        self.smtp_server = CONFIG.smtp_server
+        self.smtp_port = CONFIG.smtp_port
+        self.email_user = CONFIG.email_user
+        self.email_password = CONFIG.email_password
+        self.email_from = CONFIG.email_from
+        self.email_enabled = CONFIG.email_enabled
+        if not self.email_enabled:
+            print("⚠️  Email credentials not found. Email sending is disabled.")
+        
+        # S3 configuration (optional)
+        self.s3_handler = S3Handler()
+        
+        self._init_styles()
+    
+    @classmethod
+    def _init_styles(cls):
+        """Build the custom PDF paragraph styles once per process"""
+        if cls._styles is not None:
+            return
+        
+        cls._styles = {
+            'title': ParagraphStyle(
+                'CustomTitle',
+                parent=_SAMPLE_STYLES['Heading1'],
+                fontSize=24,
+                textColor='#1a1a1a',
+                spaceAfter=30,
+                alignment=TA_CENTER
+            ),
+            'heading': ParagraphStyle(
+                'CustomHeading',
+                parent=_SAMPLE_STYLES['Heading2'],
+                fontSize=18,
+                textColor='#2c3e50',
+                spaceAfter=12,
+                spaceBefore=12
+            ),
+            'sub': ParagraphStyle(
+                'CustomSubHeading',
+                parent=_SAMPLE_STYLES['Heading3'],
+                fontSize=14,
+                textColor='#34495e',
+                spaceAfter=8,
+                spaceBefore=8
+            ),
+            'body': ParagraphStyle(
+                'CustomBody',
+                parent=_SAMPLE_STYLES['Normal'],
+                fontSize=11,
+                textColor='#333333',
+                spaceAfter=12,
+                alignment=TA_JUSTIFY,
+                leading=14
+            ),
+        }
+    
+    def generate_blog_article(self, prompt: str) -> str:
+        """
+        Generate a blog article using OpenAI API
+        
+        Args:
+            prompt: The topic or prompt for the blog article
+            
+        Returns:
+            The generated blog article text
+        """
+        return '\n'.join(self.stream_blog_article(prompt))
+    
+    def stream_blog_article(self, prompt: str) -> Iterator[str]:
+        """
+        Generate a blog article using the OpenAI streaming API
+        
+        Lines are yielded as soon as they are complete, so callers can start
+        processing the article while the rest is still being generated.
+        
+        Args:
+            prompt: The topic or prompt for the blog article
+            
+        Yields:
+            Lines of the generated article, without trailing newlines
+        """
+        # Try to load custom prompt from frame.txt
+        system_prompt = self._load_prompt_template()
+        
+        try:
+            with self._openai_slots:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": f"Topic: {prompt}\nAudience: General readers interested in the topic\nGenerate the blog following the system instructions."}
+                    ],
+                    temperature=0.7,
+                    max_tokens=3000,
+                    stream=True
+                )
+                
+                # Closing the response releases its HTTP connection if the
+                # caller stops reading early
+                with contextlib.closing(response):
+                    buffer = ""
+                    for chunk in response:
+                        if not chunk.choices:
+                            continue
+                        buffer += chunk.choices[0].delta.content or ""
+                        while '\n' in buffer:
+                            line, buffer = buffer.split('\n', 1)
+                            yield line
+                    yield buffer
+        except Exception as e:
+            raise Exception(f"Error generating blog article: {str(e)}")
+    
+    def generate_blog_pdf(self, prompt: str, output_path: str, title: str = "Blog Article") -> str:
+        """
+        Generate a blog article and build its PDF while the article streams in
+        
+        Args:
+            prompt: The topic or prompt for the blog article
+            output_path: Path where the PDF will be saved
+            title: Title for the PDF document
+            
+        Returns:
+            The generated blog article text
+        """
+        lines = []
+        
+        def collect(stream):
+            for line in stream:
+                lines.append(line)
+                yield line
+        
+        # Close the stream even if create_pdf fails part way, so the OpenAI
+        # concurrency slot and HTTP response are released immediately rather
+        # than when the exception's traceback is garbage collected
+        with contextlib.closing(self.stream_blog_article(prompt)) as stream:
+            self.create_pdf(collect(stream), output_path, title=title)
+        return '\n'.join(lines)
+    
+    def embed_text(self, text: str) -> list:
+        """
+        Embed text with the OpenAI embeddings API
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            Unit-length embedding vector
+        """
+        response = self.client.embeddings.create(model="text-embedding-3-small", input=text)
+        return response.data[0].embedding
+    
+    def _load_prompt_template(self) -> str:
+        """
+        Load prompt template from frame.txt if it exists, otherwise use default
+        
+        The template is cached and only re-read when frame.txt changes.
+        
+        Returns:
+            System prompt string
+        """
+        frame_file = "frame.txt"
+        
+        try:
+            mtime_ns = os.stat(frame_file).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        
+        if _PROMPT_CACHE['content'] is not None and _PROMPT_CACHE['mtime'] == mtime_ns:
+            return _PROMPT_CACHE['content']
+        
+        content = None
+        if mtime_ns is not None:
+            try:
+                with open(frame_file, 'r', encoding='utf-8') as f:
+                    content = f.read().strip()
+                    if content:
+                        print("✓ Using custom prompt template from frame.txt")
+            except Exception as e:
+                print(f"⚠️  Error reading frame.txt: {str(e)}, using default prompt")
+        
+        # Default prompt if frame.txt doesn't exist or is empty
+        if not content:
+            print("✓ Using default prompt template")
+            content = DEFAULT_PROMPT
+        
+        _PROMPT_CACHE['mtime'] = mtime_ns
+        _PROMPT_CACHE['content'] = content
+        return content
+    
+    def create_pdf(self, article: Union[str, Iterable[str]], output_path: str, title: str = "Blog Article"):
+        """
+        Convert the blog article to a PDF file
+        
+        Args:
+            article: The blog article text, or an iterable of its lines
+            output_path: Path where the PDF will be saved
+            title: Title for the PDF document
+        """
+        story = []
+        
+        # Parse and add content: one regex pass over the whole article, or
+        # one match per line as the lines arrive
+        if isinstance(article, str):
+            matches = _LINE_RE.finditer(article)
+        else:
+            matches = (_LINE_RE.match(line) for line in article)
+        
+        for match in matches:
+            marker, text = match.groups()
+            if marker is None and not text:
+                story.append(Spacer(1, 0.2*inch))
+                continue
+            
+            # Process inline markdown for bold and italic
+            if '*' in text:
+                # Bold: **text** -> <b>text</b>
+                text = _BOLD_RE.sub(r'<b>\1</b>', text)
+                # Italic: *text* -> <i>text</i>
+                text = _ITALIC_RE.sub(r'<i>\1</i>', text)
+            
+            # Title (#), main heading (##), subheading (###) or body text
+            story.append(Paragraph(text, self._styles[_MARKER_STYLES[marker]]))
+        
+        # Write straight to the output file rather than an in-memory buffer
+        with open(output_path, 'wb') as f:
+            doc = SimpleDocTemplate(f, pagesize=letter)
+            doc.build(story)
+    
+    def load_email_list(self, file_path: str = "email_list.txt") -> list:
+        """
+        Load email addresses from a text file
+        
+        Args:
+            file_path: Path to the file containing email addresses
+            
+        Returns:
+            List of email addresses
+        """
+        if not os.path.exists(file_path):
+            print(f"Warning: {file_path} not found. Creating a sample file.")
+            with open(file_path, 'w') as f:
+                f.write("# Add email addresses here, one per line\n")
+                f.write("# Lines starting with # are ignored\n")
+            return []
+        
+        emails = []
+        with open(file_path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    emails.append(line)
+        
+        return emails
+    
+    def _open_smtp(self) -> smtplib.SMTP:
+        """
+        Open an authenticated SMTP connection
+        
+        Returns:
+            Connected SMTP client; the caller is responsible for calling quit()
+        """
+        print(f"Connecting to SMTP server: {self.smtp_server}:{self.smtp_port}")
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        server.set_debuglevel(1)  # Enable debug output
+        server.ehlo()
+        server.starttls()
+        server.ehlo()
+        print(f"Logging in as: {self.email_user}")
+        server.login(self.email_user, self.email_password)
+        return server
+    
+    def _read_attachment(self, pdf_path: str) -> Optional[bytes]:
+        """
+        Read the PDF attachment
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            PDF contents, or None if the file does not exist
+        """
+        if not os.path.exists(pdf_path):
+            return None
+        
+        with open(pdf_path, 'rb') as f:
+            return f.read()
+    
+    def _build_message(self, pdf_path: str, subject: str, s3_url: str = None, attachment: bytes = None) -> EmailMessage:
+        """
+        Build the email message
+        
+        The 'To' header is left for the caller to set, so one message can be
+        reused for several recipients without re-encoding the attachment.
+        
+        Args:
+            pdf_path: Path to the PDF file (used for the attachment filename)
+            subject: Email subject line
+            s3_url: Optional S3 URL to include in email body
+            attachment: Optional PDF contents from _read_attachment
+            
+        Returns:
+            The email message, ready to address and send
+        """
+        msg = EmailMessage()
+        msg['From'] = self.email_from
+        msg['Subject'] = subject
+        
+        # Email body
+        body = f"""
+Hello,
+
+Your requested blog article is ready!
+
+"""
+        if s3_url:
+            body += f"You can download it from: {s3_url}\n\n"
+        
+        body += """
+The PDF is also attached to this email.
+
+Best regards,
+EduvateHub
+"""
+        
+        msg.set_content(body)
+        
+        # Attach PDF
+        if attachment is not None:
+            msg.add_attachment(attachment, maintype='application', subtype='pdf',
+                               filename=os.path.basename(pdf_path))
+        
+        return msg
+    
+    def send_email(self, recipient: str, pdf_path: str, subject: str = "Your Blog Article", s3_url: str = None):
+        """
+        Send an email with the PDF attachment or S3 link
+        
+        Args:
+            recipient: Email address to send to
+            pdf_path: Path to the PDF file
+            subject: Email subject line
+            s3_url: Optional S3 URL to include in email body
+        """
+        if not self.email_enabled:
+            print(f"⚠️  Email not configured, skipping email to {recipient}")
+            return
+        
+        try:
+            msg = self._build_message(pdf_path, subject, s3_url, self._read_attachment(pdf_path))
+            msg['To'] = recipient
+            
+            server = self._open_smtp()
+            print(f"Sending email to: {recipient}")
+            server.send_message(msg)
+            server.quit()
+            
+            print(f"✓ Email sent successfully to {recipient}")
+            
+        except Exception as e:
+            print(f"✗ Error sending email to {recipient}: {str(e)}")
+            raise
+    
+    def send_emails_bulk(self, recipients: list, pdf_path: str, subject: str = "Your Blog Article",
+                         s3_url: str = None, attachment: bytes = None) -> list:
+        """
+        Send the PDF to several recipients over a single SMTP connection
+        
+        The connection is opened and authenticated once, so STARTTLS and LOGIN
+        are not repeated per recipient. The message is built once as well; only
+        its 'To' header changes between recipients. A failure for one recipient
+        is reported and does not stop the others.
+        
+        Args:
+            recipients: Email addresses to send to
+            pdf_path: Path to the PDF file
+            subject: Email subject line
+            s3_url: Optional S3 URL to include in email body
+            attachment: Optional PDF contents; read from pdf_path if omitted
+            
+        Returns:
+            List of recipients the email was sent to successfully
+        """
+        if not self.email_enabled:
+            print(f"⚠️  Email not configured, skipping email to {len(recipients)} recipients")
+            return []
+        
+        # Read and encode the PDF once for the whole batch
+        if attachment is None:
+            attachment = self._read_attachment(pdf_path)
+        msg = self._build_message(pdf_path, subject, s3_url, attachment)
+        
+        emails_sent = []
+        server = None
+        try:
+            for recipient in recipients:
+                try:
+                    del msg['To']
+                    msg['To'] = recipient
+                    if server is None:
+                        server = self._open_smtp()
+                    print(f"Sending email to: {recipient}")
+                    server.send_message(msg)
+                    emails_sent.append(recipient)
+                    print(f"✓ Email sent successfully to {recipient}")
+                except smtplib.SMTPServerDisconnected as e:
+                    # Reconnect for the remaining recipients
+                    print(f"✗ Error sending email to {recipient}: {str(e)}")
+                    server = None
+                except Exception as e:
+                    print(f"✗ Error sending email to {recipient}: {str(e)}")
+        finally:
+            if server is not None:
+                try:
+                    server.quit()
+                except smtplib.SMTPException:
+                    pass
+        
+        return emails_sent
+    
+    def send_emails(self, recipients: list, pdf_path: str, subject: str = "Your Blog Article",
+                    s3_url: str = None, max_connections: int = 4) -> list:
+        """
+        Send the PDF to several recipients concurrently
+        
+        Recipients are split across a few SMTP connections that run in parallel;
+        each connection sends its share with send_emails_bulk.
+        
+        Args:
+            recipients: Email addresses to send to
+            pdf_path: Path to the PDF file
+            subject: Email subject line
+            s3_url: Optional S3 URL to include in email body
+            max_connections: Maximum number of concurrent SMTP connections
+            
+        Returns:
+            List of recipients the email was sent to successfully
+        """
+        if not recipients:
+            return []
+        
+        workers = min(max_connections, len(recipients))
+        batches = [recipients[i::workers] for i in range(workers)]
+        
+        # Read the PDF once; each connection builds its own message from it
+        attachment = self._read_attachment(pdf_path)
+        
+        emails_sent = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.send_emails_bulk, batch, pdf_path, subject=subject, s3_url=s3_url,
+                                attachment=attachment)
+                for batch in batches
+            ]
+            for future in as_completed(futures):
+                try:
+                    emails_sent.extend(future.result())
+                except Exception as e:
+                    print(f"Error sending email batch: {str(e)}")
+        
+        return emails_sent
+    
+    def process(self, prompt: str, email_list_file: str = "email_list.txt"):
+        """
+        Main processing function: generate article, create PDF, upload to S3, and send emails
+        
+        Args:
+            prompt: The topic/prompt for the blog article
+            email_list_file: Path to file containing email addresses
+        """
+        print(f"Generating blog article for: {prompt}")
+        
+        # Generate article and create PDF as it streams in
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_prompt = sanitize_filename(prompt)
+        pdf_filename = f"blog_article_{safe_prompt}_{timestamp}.pdf"
+        
+        print("Creating blog article...")
+        print(f"Creating PDF: {pdf_filename}")
+        self.generate_blog_pdf(prompt, pdf_filename, title=prompt)
+        print("✓ Blog article generated successfully")
+        print("✓ PDF created successfully")
+        
+        # Upload to S3 if configured, in the background while the email list loads
+        s3_url = None
+        upload = None
+        if self.s3_handler.enabled:
+            print("\nUploading PDF to S3...")
+            upload = self.s3_handler.upload_file_async(pdf_filename)
+        
+        emails = self.load_email_list(email_list_file) if self.email_enabled else []
+        
+        if upload is not None:
+            s3_url = upload.result()
+            if s3_url:
+                print(f"✓ S3 URL: {s3_url}")
+        
+        if not self.email_enabled:
+            print("\nEmail credentials not configured, skipping email delivery.")
+            print(f"PDF saved locally as: {pdf_filename}")
+            if s3_url:
+                print(f"PDF available at: {s3_url}")
+            return pdf_filename
+
+        if not emails:
+            print(f"\nNo email addresses found in {email_list_file}")
+            print(f"PDF saved locally as: {pdf_filename}")
+            if s3_url:
+                print(f"PDF available at: {s3_url}")
+            return pdf_filename
+        
+        print(f"\nSending emails to {len(emails)} recipients...")
+        emails_sent = self.send_emails(emails, pdf_filename, subject=f"Blog Article: {prompt}", s3_url=s3_url)
+        if not emails_sent:
+            raise Exception(f"Failed to send email to all {len(emails)} recipients")
+        if len(emails_sent) < len(emails):
+            print(f"⚠️  Sent to {len(emails_sent)} of {len(emails)} recipients")
+        
+        print(f"\n✓ Process completed!")
+        print(f"PDF saved locally as: {pdf_filename}")
+        if s3_url:
+            print(f"PDF available at: {s3_url}")
+        
+        return pdf_filename
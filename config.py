@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Configuration - Settings read from environment variables once at startup
+"""
+
+import os
+from dataclasses import dataclass, field
+from dotenv import load_dotenv
+from typing import Optional
+
+# Load environment variables
+load_dotenv()
+
+
+def _env_int(name: str, default: int, minimum: Optional[int] = None) -> int:
+    """
+    Read an integer environment variable
+    
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset, empty, not an integer
+                 or below minimum
+        minimum: Optional smallest accepted value
+        
+    Returns:
+        The parsed value, or default
+    """
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        print(f"⚠️  Invalid integer for {name}: {value!r}. Using default: {default}")
+        return default
+    if minimum is not None and parsed < minimum:
+        print(f"⚠️  {name} must be at least {minimum}, got {parsed}. Using default: {default}")
+        return default
+    return parsed
+
+
+@dataclass(frozen=True)
+class Config:
+    """Blog generator and API settings"""
+    
+    # Secrets are left out of repr() so logging CONFIG does not leak them
+    openai_api_key: Optional[str] = field(repr=False)
+    openai_model: str
+    openai_max_concurrency: int
+    
+    # Email (optional)
+    smtp_server: str
+    smtp_port: int
+    email_user: Optional[str]
+    email_password: Optional[str] = field(repr=False)
+    
+    # S3 bucket name, used to report S3 availability (see S3Handler for upload settings)
+    s3_bucket_name: Optional[str]
+    
+    # API
+    blog_workers: int
+    job_result_ttl: int
+    blog_cache_ttl: int
+    blog_cache_semantic: bool
+    
+    @property
+    def email_from(self) -> Optional[str]:
+        """Sender address for outgoing emails"""
+        return self.email_user
+    
+    @property
+    def email_enabled(self) -> bool:
+        """Whether all SMTP credentials needed to send email are set"""
+        return all([self.smtp_server, self.smtp_port, self.email_user, self.email_password, self.email_from])
+    
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Build the configuration from environment variables"""
+        return cls(
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            openai_model=os.getenv("OPENAI_MODEL", "gpt-4"),
+            openai_max_concurrency=_env_int("OPENAI_MAX_CONCURRENCY", 4),
+            smtp_server=os.getenv("SMTP_SERVER") or "smtp.gmail.com",
+            smtp_port=_env_int("SMTP_PORT", 587),
+            email_user=os.getenv("EMAIL_USER"),
+            email_password=os.getenv("EMAIL_PASSWORD"),
+            s3_bucket_name=os.getenv("AWS_S3_BUCKET_NAME"),
+            blog_workers=_env_int("BLOG_WORKERS", 8),
+            job_result_ttl=_env_int("JOB_RESULT_TTL", 3600),
+            blog_cache_ttl=_env_int("BLOG_CACHE_TTL", 86400),
+            blog_cache_semantic=os.getenv("BLOG_CACHE_SEMANTIC", "false").lower() == "true",
+        )
+
+
+CONFIG = Config.from_env()
@@ -0,0 +1,21 @@
+"""
+Gunicorn configuration for the Blog Generator API
+
+Usage: gunicorn -c gunicorn.conf.py app:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('FLASK_PORT', '5000')}"
+
+# gevent workers make socket I/O cooperative, so a single worker can serve many
+# requests while OpenAI, SMTP and S3 calls are in flight.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gevent")
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+
+# Generation jobs and the article cache live in process memory, so a job can
+# only be polled on the worker that created it. Keep a single worker unless that
+# state is moved to shared storage.
+workers = int(os.getenv("GUNICORN_WORKERS", "1"))
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
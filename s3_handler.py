@@ -3,17 +3,42 @@
 S3 Handler - Manages file uploads to AWS S3
 """
 
+import hashlib
+import mmap
 import os
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
-from typing import Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Tuple
+from config import _env_int
+
+# Smallest part size S3 accepts for multipart uploads
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+# Read buffer for uploads; larger reads mean fewer syscalls per upload
+UPLOAD_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Files above this size are memory-mapped instead of read through a buffer
+MMAP_THRESHOLD = 256 * 1024 * 1024
+
+# Connections in the shared S3 client's pool
+MAX_POOL_CONNECTIONS = max(32, (os.cpu_count() or 1) * 4)
+
+# Runs uploads started with S3Handler.upload_file_async
+_UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="s3-upload")
 
 
 class S3Handler:
+    # Client shared by every handler, created on first use
+    _client = None
+    _client_lock = threading.Lock()
+    
     def __init__(self):
         """Initialize S3 client with credentials from environment variables"""
         self.bucket_name = os.getenv("AWS_S3_BUCKET_NAME")
         self.region = os.getenv("AWS_REGION", "us-east-1")
+        # Virtual-hosted-style bucket host; object URLs are the prefix plus the key
+        self._url_host = f"{self.bucket_name}.s3.{self.region}.amazonaws.com/"
+        self._url_prefix = f"https://{self._url_host}"
         
         # Check if S3 is configured
         aws_access_key = os.getenv("AWS_ACCESS_KEY_ID")
@@ -27,12 +52,20 @@ class S3Handler:
             return
         
         try:
-            # Initialize S3 client
-            self.s3_client = boto3.client(
-                's3',
-                aws_access_key_id=aws_access_key,
-                aws_secret_access_key=aws_secret_key,
-                region_name=self.region
+            # boto3 is imported only once S3 is known to be configured, so
+            # runs without S3 skip its import cost
+            from boto3.s3.transfer import TransferConfig
+            
+            self.s3_client = self._get_client(aws_access_key, aws_secret_key, self.region)
+            # Split large files into concurrently uploaded parts. S3 parts must be
+            # at least 5 MB, and smaller files are sent as a single PUT to avoid
+            # the extra multipart initiate/complete round-trips.
+            part_size = max(MIN_PART_SIZE, _env_int("S3_MULTIPART_CHUNKSIZE_MB", 8, minimum=1) * 1024 * 1024)
+            self.transfer_config = TransferConfig(
+                multipart_threshold=max(MIN_PART_SIZE, _env_int("S3_MULTIPART_THRESHOLD_MB", 8, minimum=1) * 1024 * 1024),
+                multipart_chunksize=part_size,
+                max_concurrency=_env_int("S3_CONCURRENCY", 10, minimum=1),
+                use_threads=True
             )
             print(f"✓ S3 client initialized for bucket: {self.bucket_name}")
         except Exception as e:
@@ -40,13 +73,55 @@ class S3Handler:
             self.enabled = False
             self.s3_client = None
     
-    def upload_file(self, file_path: str, s3_key: Optional[str] = None) -> Optional[str]:
+    @classmethod
+    def _get_client(cls, aws_access_key: str, aws_secret_key: str, region: str):
+        """
+        Get the shared S3 client, creating it on first use
+        
+        boto3 clients are thread-safe, so one client (and its connection pool)
+        is shared across handlers, requests and upload threads. Connections are
+        kept alive between requests to avoid a TLS handshake per upload.
+        
+        Args:
+            aws_access_key: AWS access key ID
+            aws_secret_key: AWS secret access key
+            region: AWS region name
+            
+        Returns:
+            boto3 S3 client
+        """
+        if cls._client is None:
+            with cls._client_lock:
+                if cls._client is None:
+                    import boto3
+                    from botocore.config import Config
+                    
+                    session = boto3.session.Session(
+                        aws_access_key_id=aws_access_key,
+                        aws_secret_access_key=aws_secret_key,
+                        region_name=region
+                    )
+                    cls._client = session.client(
+                        's3',
+                        config=Config(
+                            max_pool_connections=MAX_POOL_CONNECTIONS,
+                            tcp_keepalive=True,
+                            retries={'max_attempts': 5, 'mode': 'adaptive'}
+                        )
+                    )
+        return cls._client
+    
+    def upload_file(self, file_path: str, s3_key: Optional[str] = None,
+                    skip_unchanged: bool = False) -> Optional[str]:
         """
         Upload a file to S3 bucket
         
         Args:
             file_path: Local path to the file to upload
             s3_key: Optional S3 object key (path in bucket). If not provided, uses filename
+            skip_unchanged: Check the existing object first and skip the upload if its
+                            content is identical. Costs a HEAD request and a local MD5
+                            pass, so only worth it for stable keys that are re-uploaded.
             
         Returns:
             S3 URL of the uploaded file, or None if upload failed
@@ -55,6 +130,8 @@ class S3Handler:
             print("S3 upload is disabled. Skipping upload.")
             return None
         
+        from botocore.exceptions import ClientError, NoCredentialsError
+        
         if not os.path.exists(file_path):
             print(f"✗ File not found: {file_path}")
             return None
@@ -63,17 +140,23 @@ class S3Handler:
         if s3_key is None:
             s3_key = os.path.basename(file_path)
         
+        # Generate S3 URL
+        s3_url = self._url_prefix + s3_key
+        
         try:
+            # Skip the upload if the object already holds identical content
+            if skip_unchanged and self._is_unchanged(file_path, s3_key):
+                print(f"✓ File unchanged in S3, skipping upload: {s3_url}")
+                return s3_url
+            
             # Upload file
-            self.s3_client.upload_file(
-                file_path,
-                self.bucket_name,
-                s3_key,
-                ExtraArgs={'ContentType': 'application/pdf'}
-            )
+            with open(file_path, 'rb', buffering=UPLOAD_BUFFER_SIZE) as f:
+                if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        self._upload_fileobj(mapped, s3_key)
+                else:
+                    self._upload_fileobj(f, s3_key)
             
-            # Generate S3 URL
-            s3_url = f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{s3_key}"
             print(f"✓ File uploaded to S3: {s3_url}")
             return s3_url
             
@@ -87,6 +170,100 @@ class S3Handler:
             print(f"✗ Unexpected error during S3 upload: {str(e)}")
             return None
     
+    def _upload_fileobj(self, fileobj, s3_key: str):
+        """Upload an open file (or memory map) to s3_key as a PDF"""
+        self.s3_client.upload_fileobj(
+            fileobj,
+            self.bucket_name,
+            s3_key,
+            ExtraArgs={'ContentType': 'application/pdf'},
+            Config=self.transfer_config
+        )
+    
+    def _is_unchanged(self, file_path: str, s3_key: str) -> bool:
+        """
+        Check whether the object at s3_key already has the same content as a local file
+        
+        Args:
+            file_path: Local path to the file to upload
+            s3_key: S3 object key to compare against
+            
+        Returns:
+            True if the remote ETag matches the local file, False otherwise
+        """
+        from botocore.exceptions import ClientError
+        
+        try:
+            head = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+        except ClientError:
+            # Missing object (or no permission to read it): upload as usual
+            return False
+        
+        return head['ETag'].strip('"') == self._local_etag(file_path)
+    
+    def _local_etag(self, file_path: str) -> str:
+        """
+        Compute the ETag S3 would assign to a file uploaded with transfer_config
+        
+        Single-PUT uploads get the MD5 of the content. Multipart uploads get the
+        MD5 of the concatenated part digests followed by "-<part count>".
+        
+        Args:
+            file_path: Local path to the file
+            
+        Returns:
+            Expected ETag (without quotes)
+        """
+        part_size = self.transfer_config.multipart_chunksize
+        multipart = os.path.getsize(file_path) >= self.transfer_config.multipart_threshold
+        
+        with open(file_path, 'rb') as f:
+            if not multipart:
+                # hashlib.file_digest (Python 3.11+) hashes straight from the file
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, 'md5').hexdigest()
+                whole = hashlib.md5()
+                while chunk := f.read(1024 * 1024):
+                    whole.update(chunk)
+                return whole.hexdigest()
+            
+            # Read one part at a time so large files are never held in memory
+            part_digests = [hashlib.md5(chunk).digest() for chunk in iter(lambda: f.read(part_size), b'')]
+        
+        return f"{hashlib.md5(b''.join(part_digests)).hexdigest()}-{len(part_digests)}"
+    
+    def upload_file_async(self, file_path: str, s3_key: Optional[str] = None) -> Future:
+        """
+        Start uploading a file to S3 in the background
+        
+        Args:
+            file_path: Local path to the file to upload
+            s3_key: Optional S3 object key (path in bucket). If not provided, uses filename
+            
+        Returns:
+            Future resolving to the result of upload_file (S3 URL or None)
+        """
+        return _UPLOAD_EXECUTOR.submit(self.upload_file, file_path, s3_key)
+    
+    def upload_files(self, items: List[Tuple[str, Optional[str]]]) -> List[Optional[str]]:
+        """
+        Upload several files to S3 concurrently
+        
+        Args:
+            items: (file_path, s3_key) pairs; s3_key may be None to use the filename
+            
+        Returns:
+            S3 URL (or None if that upload failed) for each item, in the same order
+        """
+        if not items:
+            return []
+        
+        # Each upload can open up to max_concurrency connections for its parts, so
+        # limit the number of files in flight to what the shared pool can serve
+        workers = max(1, MAX_POOL_CONNECTIONS // self.transfer_config.max_concurrency)
+        with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+            return list(executor.map(lambda item: self.upload_file(*item), items))
+    
     def generate_presigned_url(self, s3_key: str, expiration: int = 3600) -> Optional[str]:
         """
         Generate a presigned URL for temporary access to an S3 object
@@ -101,6 +278,8 @@ class S3Handler:
         if not self.enabled:
             return None
         
+        from botocore.exceptions import ClientError
+        
         try:
             url = self.s3_client.generate_presigned_url(
                 'get_object',
@@ -126,10 +305,12 @@ class S3Handler:
         if not self.enabled:
             return False
         
+        from botocore.exceptions import ClientError
+        
         try:
             # Extract S3 key from URL
             # Format: https://bucket-name.s3.region.amazonaws.com/key
-            s3_key = s3_url.split(f"{self.bucket_name}.s3.{self.region}.amazonaws.com/")[-1]
+            s3_key = s3_url.split(self._url_host)[-1]
             
             # Download file
             self.s3_client.download_file(self.bucket_name, s3_key, local_path)
@@ -3,16 +3,33 @@
 Google Sheets Manager - Manages blog topics from Google Sheets using public CSV URL
 """
 
+import csv
+import io
+import logging
 import os
-import pandas as pd
-from datetime import datetime, date
-from typing import Optional, List, Dict
+import threading
+import time
+import urllib.request
+from datetime import date
+from typing import Optional, List, Dict, Tuple
+from utils import parse_date
+
+logger = logging.getLogger(__name__)
 
 
 class SheetsManager:
-    def __init__(self):
-        """Initialize Google Sheets manager with public CSV URL"""
+    def __init__(self, cache_ttl: int = 60):
+        """
+        Initialize Google Sheets manager with public CSV URL
+        
+        Args:
+            cache_ttl: Seconds fetched topics are reused before the sheet is downloaded again
+        """
         self.csv_url = os.getenv("GOOGLE_SHEET_CSV_URL")
+        self.cache_ttl = cache_ttl
+        self._topics_cache = None
+        self._topic_dates = []
+        self._topics_cache_ts = 0.0
         
         self.enabled = bool(self.csv_url)
         
@@ -28,42 +45,67 @@ class SheetsManager:
         Returns:
             List of topic dictionaries with 'date', 'topic', and 'status' keys
         """
+        topics, _ = self._get_topics_with_dates()
+        return topics
+    
+    def _get_topics_with_dates(self) -> Tuple[List[Dict], List[Optional[date]]]:
+        """
+        Fetch topics along with their parsed dates
+        
+        Returns:
+            Tuple of the topic dictionaries and their parsed dates (same order,
+            None where the date could not be parsed)
+        """
         if not self.enabled:
-            return []
+            return [], []
+        
+        if self._topics_cache is not None and time.time() - self._topics_cache_ts < self.cache_ttl:
+            return self._topics_cache, self._topic_dates
         
         try:
             # Read CSV from public URL
-            df = pd.read_csv(self.csv_url)
+            with urllib.request.urlopen(self.csv_url, timeout=10) as response:
+                reader = csv.DictReader(io.TextIOWrapper(response, encoding='utf-8-sig'))
+                rows = list(reader)
+                columns = reader.fieldnames or []
             
             # Expected columns: Date, Topic, Status
-            if df.empty:
-                print("⚠️  No data found in Google Sheet")
-                return []
+            if not rows:
+                logger.warning("⚠️  No data found in Google Sheet")
+                self._set_topics_cache([], [])
+                return [], []
             
-            # Convert DataFrame to list of dictionaries
             topics = []
-            for index, row in df.iterrows():
-                # Skip rows without date or topic
-                if pd.isna(row.get('Date')) or pd.isna(row.get('Topic')):
-                    continue
-                
-                topic_dict = {
-                    'date': str(row.get('Date', '')).strip(),
-                    'topic': str(row.get('Topic', '')).strip(),
-                    'status': str(row.get('Status', '')).strip() if not pd.isna(row.get('Status')) else '',
-                    'row': index + 2  # +2 because index starts at 0 and row 1 is header
-                }
-                
-                # Only include rows with both date and topic
-                if topic_dict['date'] and topic_dict['topic']:
-                    topics.append(topic_dict)
+            if 'Date' in columns and 'Topic' in columns:
+                # +2 because rows start at 0 and row 1 is header
+                for row_num, row in enumerate(rows, 2):
+                    date_str = (row.get('Date') or '').strip()
+                    topic = (row.get('Topic') or '').strip()
+                    
+                    # Only include rows with both date and topic
+                    if date_str and topic:
+                        topics.append({
+                            'date': date_str,
+                            'topic': topic,
+                            'status': (row.get('Status') or '').strip(),
+                            'row': row_num
+                        })
+            
+            dates = [parse_date(topic_dict['date']) for topic_dict in topics]
             
-            print(f"✓ Fetched {len(topics)} topics from Google Sheet")
-            return topics
+            logger.info("✓ Fetched %d topics from Google Sheet", len(topics))
+            self._set_topics_cache(topics, dates)
+            return topics, dates
             
         except Exception as e:
-            print(f"✗ Error fetching topics from Google Sheet: {str(e)}")
-            return []
+            logger.error("✗ Error fetching topics from Google Sheet: %s", e)
+            return [], []
+    
+    def _set_topics_cache(self, topics: List[Dict], dates: List[Optional[date]]):
+        """Remember fetched topics and their parsed dates for cache_ttl seconds"""
+        self._topics_cache = topics
+        self._topic_dates = dates
+        self._topics_cache_ts = time.time()
     
     def get_topic_for_date(self, target_date: Optional[date] = None) -> Optional[str]:
         """
@@ -78,34 +120,35 @@ class SheetsManager:
         if target_date is None:
             target_date = date.today()
         
-        topics = self.get_topics()
+        topics, dates = self._get_topics_with_dates()
         
         if not topics:
             return None
         
+        return self._find_topic_for_date(topics, dates, target_date)
+    
+    def _find_topic_for_date(self, topics: List[Dict], dates: List[Optional[date]], target_date: date) -> Optional[str]:
+        """
+        Find the topic scheduled for a date in already fetched topics
+        
+        Args:
+            topics: Topic dictionaries from get_topics
+            dates: Parsed topic dates from _get_topics_with_dates
+            target_date: Date to get topic for
+            
+        Returns:
+            Topic string, or None if no topic found for the date
+        """
         # Convert target date to string format for comparison
         target_date_str = target_date.strftime("%Y-%m-%d")
         
-        # Find topic matching the target date
-        for topic_dict in topics:
-            try:
-                # Try to parse the date from the sheet
-                topic_date_str = topic_dict['date']
-                
-                # Support multiple date formats
-                for date_format in ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d"]:
-                    try:
-                        parsed_date = datetime.strptime(topic_date_str, date_format).date()
-                        if parsed_date == target_date:
-                            print(f"📅 Found topic for {target_date_str}: {topic_dict['topic']}")
-                            return topic_dict['topic']
-                        break
-                    except ValueError:
-                        continue
-            except Exception:
-                continue
+        # Find the first topic matching the target date
+        for topic_dict, parsed_date in zip(topics, dates):
+            if parsed_date == target_date:
+                logger.info("📅 Found topic for %s: %s", target_date_str, topic_dict['topic'])
+                return topic_dict['topic']
         
-        print(f"⚠️  No topic found for date: {target_date_str}")
+        logger.warning("⚠️  No topic found for date: %s", target_date_str)
         return None
     
     def get_next_available_topic(self) -> Optional[str]:
@@ -115,50 +158,63 @@ class SheetsManager:
         Returns:
             Topic string, or None if no topics available
         """
-        topics = self.get_topics()
+        topics, dates = self._get_topics_with_dates()
         
         if not topics:
             return None
         
         today = date.today()
         
-        # First try to get today's topic
-        today_topic = self.get_topic_for_date(today)
-        if today_topic:
-            return today_topic
-        
-        # If no topic for today, find the next future topic
-        future_topics = []
-        for topic_dict in topics:
-            try:
-                topic_date_str = topic_dict['date']
-                for date_format in ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d"]:
-                    try:
-                        parsed_date = datetime.strptime(topic_date_str, date_format).date()
-                        if parsed_date >= today:
-                            future_topics.append((parsed_date, topic_dict['topic']))
-                        break
-                    except ValueError:
-                        continue
-            except Exception:
+        # Single pass: return today's topic as soon as it is seen, otherwise
+        # remember the earliest future topic (first listed on ties)
+        next_date, next_topic = None, None
+        for topic_dict, parsed_date in zip(topics, dates):
+            if parsed_date is None or parsed_date < today:
                 continue
-        
-        if future_topics:
-            # Sort by date and get the earliest
-            future_topics.sort(key=lambda x: x[0])
-            next_date, next_topic = future_topics[0]
-            print(f"📅 Next scheduled topic for {next_date}: {next_topic}")
+            if parsed_date == today:
+                logger.info("📅 Found topic for %s: %s", today.strftime('%Y-%m-%d'), topic_dict['topic'])
+                return topic_dict['topic']
+            if next_date is None or parsed_date < next_date:
+                next_date, next_topic = parsed_date, topic_dict['topic']
+        
+        logger.warning("⚠️  No topic found for date: %s", today.strftime('%Y-%m-%d'))
+        if next_topic is not None:
+            logger.info("📅 Next scheduled topic for %s: %s", next_date, next_topic)
             return next_topic
         
-        print("⚠️  No future topics found in Google Sheet")
+        logger.warning("⚠️  No future topics found in Google Sheet")
         return None
 
 
+_SHEETS_SINGLETON: Optional[SheetsManager] = None
+_SHEETS_LOCK = threading.Lock()
+
+
+def get_sheets_manager() -> SheetsManager:
+    """
+    Get the process-wide SheetsManager, creating it on first use
+    
+    Sharing one manager means the environment is read once and the topics
+    cache is shared, so repeated lookups download the sheet once per TTL.
+    
+    Returns:
+        Shared SheetsManager instance
+    """
+    global _SHEETS_SINGLETON
+    if _SHEETS_SINGLETON is None:
+        with _SHEETS_LOCK:
+            if _SHEETS_SINGLETON is None:
+                _SHEETS_SINGLETON = SheetsManager()
+    return _SHEETS_SINGLETON
+
+
 def main():
     """CLI interface for sheets manager"""
     import sys
     
-    manager = SheetsManager()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
+    manager = get_sheets_manager()
     
     if not manager.enabled:
         print("Google Sheets is not configured. Please set GOOGLE_SHEET_CSV_URL")
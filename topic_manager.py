@@ -3,9 +3,25 @@
 Topic Manager - Handles topic rotation and date-based scheduling from local file
 """
 
+import logging
 import os
+import threading
+from bisect import bisect_left
 from datetime import datetime, date
-from typing import Optional, List, Dict
+from typing import NamedTuple, Optional, List, Dict, Tuple
+from utils import parse_date
+
+logger = logging.getLogger(__name__)
+
+
+class _TopicIndex(NamedTuple):
+    """Topics loaded from the file together with their date index"""
+    topics: List[Dict]
+    # First topic listed for each date, for O(1) date lookups
+    by_date: Dict[date, str]
+    # (date, topic) pairs sorted by date (file order within a date), for bisecting
+    schedule: List[Tuple[date, str]]
+    schedule_dates: List[date]
 
 
 class TopicManager:
@@ -17,16 +33,65 @@ class TopicManager:
             topics_file: Path to file containing topics with dates (format: YYYY-MM-DD|Topic)
         """
         self.topics_file = topics_file
-        self.topics = self._load_topics()
+        # Serializes reloads; readers take one snapshot of self._index instead
+        self._lock = threading.Lock()
+        self._mtime_ns = self._get_mtime_ns()
+        self._reload()
+    
+    @property
+    def topics(self) -> List[Dict]:
+        """Topics loaded from the topics file"""
+        return self._index.topics
+    
+    def _get_mtime_ns(self) -> Optional[int]:
+        """Return the topics file modification time, or None if it does not exist"""
+        try:
+            return os.stat(self.topics_file).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _refresh(self):
+        """Reload topics if the topics file has changed since it was last read"""
+        mtime_ns = self._get_mtime_ns()
+        if mtime_ns == self._mtime_ns:
+            return
+        
+        with self._lock:
+            if mtime_ns != self._mtime_ns:
+                self._reload()
+                self._mtime_ns = mtime_ns
+    
+    def _reload(self):
+        """
+        Load topics from the topics file and index them by parsed date
+        
+        The index is built in local variables and published with a single
+        assignment, so concurrent readers see either the old or the new index.
+        """
+        topics = self._load_topics()
+        
+        by_date: Dict[date, str] = {}
+        schedule: List[Tuple[date, str]] = []
+        for topic_dict in topics:
+            parsed_date = parse_date(topic_dict['date'])
+            if parsed_date is None:
+                continue
+            by_date.setdefault(parsed_date, topic_dict['topic'])
+            schedule.append((parsed_date, topic_dict['topic']))
+        schedule.sort(key=lambda x: x[0])
+        
+        self._index = _TopicIndex(topics, by_date, schedule, [scheduled_date for scheduled_date, _ in schedule])
     
     def _load_topics(self) -> List[Dict]:
-        """Load topics with dates from the topics file"""
-        if not os.path.exists(self.topics_file):
+        """Load topics with dates from the topics file (empty if it cannot be read)"""
+        topics = []
+        try:
+            f = open(self.topics_file, 'r', encoding='utf-8')
+        except OSError:
             print(f"⚠️  Topics file '{self.topics_file}' not found.")
             return []
         
-        topics = []
-        with open(self.topics_file, 'r', encoding='utf-8') as f:
+        with f:
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
                 # Skip empty lines and comments
@@ -34,15 +99,14 @@ class TopicManager:
                     continue
                 
                 # Parse date|topic format
-                if '|' in line:
-                    parts = line.split('|', 1)
-                    if len(parts) == 2:
-                        date_str, topic = parts
-                        topics.append({
-                            'date': date_str.strip(),
-                            'topic': topic.strip(),
-                            'line': line_num
-                        })
+                date_str, sep, topic = line.partition('|')
+                if not sep:
+                    continue
+                topics.append({
+                    'date': date_str.strip(),
+                    'topic': topic.strip(),
+                    'line': line_num
+                })
         
         return topics
     
@@ -59,31 +123,21 @@ class TopicManager:
         if target_date is None:
             target_date = datetime.utcnow().date()  # Use UTC for GitHub Actions compatibility
         
-        if not self.topics:
+        self._refresh()
+        index = self._index
+        if not index.topics:
             return None
         
         # Convert target date to string format for comparison
         target_date_str = target_date.strftime("%Y-%m-%d")
         
         # Find topic matching the target date
-        for topic_dict in self.topics:
-            try:
-                topic_date_str = topic_dict['date']
-                
-                # Support multiple date formats
-                for date_format in ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d"]:
-                    try:
-                        parsed_date = datetime.strptime(topic_date_str, date_format).date()
-                        if parsed_date == target_date:
-                            print(f"📅 Found topic for {target_date_str}: {topic_dict['topic']}")
-                            return topic_dict['topic']
-                        break
-                    except ValueError:
-                        continue
-            except Exception:
-                continue
+        topic = index.by_date.get(target_date)
+        if topic is not None:
+            logger.info("📅 Found topic for %s: %s", target_date_str, topic)
+            return topic
         
-        print(f"⚠️  No topic found for date: {target_date_str}")
+        logger.warning("⚠️  No topic found for date: %s", target_date_str)
         return None
     
     def get_next_available_topic(self) -> Optional[str]:
@@ -94,50 +148,42 @@ class TopicManager:
         Returns:
             Topic string, or None if no topics available
         """
-        if not self.topics:
-            print("⚠️  No topics available in topics file.")
+        self._refresh()
+        index = self._index
+        if not index.topics:
+            logger.warning("⚠️  No topics available in topics file.")
             return None
         
         today = datetime.utcnow().date()  # Use UTC for GitHub Actions
         
-        # First try to get today's topic
-        today_topic = self.get_topic_for_date(today)
-        if today_topic:
+        # First try to get today's topic, from the same snapshot
+        today_str = today.strftime("%Y-%m-%d")
+        today_topic = index.by_date.get(today)
+        if today_topic is not None:
+            logger.info("📅 Found topic for %s: %s", today_str, today_topic)
             return today_topic
+        logger.warning("⚠️  No topic found for date: %s", today_str)
         
-        # If no topic for today, find the next future topic
-        future_topics = []
-        for topic_dict in self.topics:
-            try:
-                topic_date_str = topic_dict['date']
-                for date_format in ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d"]:
-                    try:
-                        parsed_date = datetime.strptime(topic_date_str, date_format).date()
-                        if parsed_date >= today:
-                            future_topics.append((parsed_date, topic_dict['topic']))
-                        break
-                    except ValueError:
-                        continue
-            except Exception:
-                continue
-        
-        if future_topics:
-            # Sort by date and get the earliest
-            future_topics.sort(key=lambda x: x[0])
-            next_date, next_topic = future_topics[0]
-            print(f"📅 Next scheduled topic for {next_date}: {next_topic}")
+        # If no topic for today, find the earliest future topic
+        position = bisect_left(index.schedule_dates, today)
+        if position < len(index.schedule):
+            next_date, next_topic = index.schedule[position]
+            logger.info("📅 Next scheduled topic for %s: %s", next_date, next_topic)
             return next_topic
         
-        print("⚠️  No future topics found")
+        logger.warning("⚠️  No future topics found")
         return None
     
     def get_all_topics(self) -> List[Dict]:
         """Get all topics with their dates"""
+        self._refresh()
         return self.topics
     
     def reset(self):
         """Reload topics from file"""
-        self.topics = self._load_topics()
+        with self._lock:
+            self._mtime_ns = self._get_mtime_ns()
+            self._reload()
         print("✓ Topics reloaded from file")
 
 
@@ -145,6 +191,8 @@ def main():
     """CLI interface for topic manager"""
     import sys
     
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     manager = TopicManager()
     
     if len(sys.argv) > 1:
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Utilities - Helpers shared by the CLI and the API
+"""
+
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Optional
+
+# Supported schedule date formats, tried in order
+DATE_FORMATS = ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d"]
+
+# Anything other than word characters (letters, digits, underscore), spaces and hyphens
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w -]')
+
+
+def sanitize_filename(text: str, max_length: int = 50) -> str:
+    """
+    Turn free text (e.g. a blog topic) into a safe filename fragment
+    
+    Args:
+        text: Text to sanitize
+        max_length: Number of leading characters of text to use
+        
+    Returns:
+        The text with unsafe characters removed and spaces replaced by underscores
+    """
+    return _UNSAFE_FILENAME_CHARS.sub('', text[:max_length]).strip().replace(' ', '_')
+
+
+@lru_cache(maxsize=2048)
+def parse_date(date_str: str) -> Optional[date]:
+    """
+    Parse a schedule date using the first supported format that matches
+    
+    Results are cached, since the same date strings are parsed again on every
+    reload of the schedule.
+    
+    Args:
+        date_str: Date string (e.g. "2024-01-31" or "01/31/2024")
+        
+    Returns:
+        The parsed date, or None if no supported format matches
+    """
+    # Fast path for ISO dates (YYYY-MM-DD), by far the most common format
+    if (len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-'
+            and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()):
+        try:
+            return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+        except ValueError:
+            pass
+    
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, date_format).date()
+        except ValueError:
+            continue
+    return None